@@ -1,15 +1,120 @@
 from crewai import Agent, Task, Crew, Process
 from crewai.tools import SerperDevTool
-from typing import List, Dict, Any
+from langchain_openai import ChatOpenAI
+from typing import List, Dict, Any, AsyncIterator, Tuple, Union
+import asyncio
 import logging
-from models import NewsArticle, Summary, FactCheck
-from config import config
+import re
+from pydantic import BaseModel, ValidationError
+from models import NewsArticle, SummarySchema, FactCheckListSchema, CredibilitySchema
+from config import Config, config
+from ..utils.text_features import top_k_sentences
 
 logger = logging.getLogger(__name__)
 
+# Output schema each stage's task is converted into, in crew execution order
+STAGE_SCHEMAS = {
+    "summary": SummarySchema,
+    "fact_checks": FactCheckListSchema,
+    "credibility": CredibilitySchema
+}
+
+# Fallback output for each stage whose result can't be parsed
+STAGE_FALLBACKS = {
+    "summary": SummarySchema(
+        summary="Unable to generate summary",
+        key_points=[],
+        sentiment="neutral"
+    ),
+    "fact_checks": FactCheckListSchema(fact_checks=[]),
+    "credibility": CredibilitySchema(
+        credibility_score=50.0,
+        assessment="Unable to assess credibility"
+    )
+}
+
+# Patterns for pulling a JSON payload out of free-form agent output
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+_JSON_OBJ = re.compile(r"\{.*\}|\[.*\]", re.DOTALL)
+
+# Character budgets for the article text sent to each task
+SUMMARY_CONTENT_CHARS = 12000
+FACTCHECK_CONTENT_CHARS = 4000
+CREDIBILITY_CONTENT_CHARS = 500
+
+# Task prompt templates, filled per article with str.format_map. The constant
+# instructions come first and the article last, so every request shares the
+# same prompt prefix and can hit the provider's prefix cache.
+_SUMMARY_TMPL = (
+    "Summarize the news article given after the ---ARTICLE--- marker.\n\n"
+    "Provide:\n"
+    "1. A concise summary (2-3 sentences)\n"
+    "2. Key points (3-5 bullet points)\n"
+    "3. Sentiment analysis (positive/negative/neutral)\n"
+    "Format your response as JSON with keys: summary, key_points, sentiment\n\n"
+    "---ARTICLE---\n"
+    "Title: {title}\n"
+    "Content: {content}"
+)
+
+_FACTCHECK_TMPL = (
+    "Fact-check the news article given after the ---ARTICLE--- marker.\n\n"
+    "Identify key claims and verify them using reliable sources. "
+    "For each claim, provide:\n"
+    "1. The specific claim\n"
+    "2. Verification status (verified/false/partially_true/unverified)\n"
+    "3. Supporting evidence\n"
+    "4. Confidence score (0-1)\n"
+    "5. Sources used for verification\n"
+    "Format as JSON with key fact_checks: an array of objects with keys "
+    "claim, verification_status, evidence, confidence_score, sources\n\n"
+    "---ARTICLE---\n"
+    "Title: {title}\n"
+    "Content: {content}"
+)
+
+_CREDIBILITY_TMPL = (
+    "Assess the credibility of the news article given after the ---ARTICLE--- marker "
+    "and of its source.\n\n"
+    "Evaluate based on:\n"
+    "1. Source reputation and reliability\n"
+    "2. Editorial standards and fact-checking practices\n"
+    "3. Author credentials and expertise\n"
+    "4. Content quality and journalistic standards\n"
+    "5. Potential bias or agenda\n"
+    "Provide a credibility score (0-100) and detailed assessment.\n"
+    "Format as JSON with keys: credibility_score, assessment\n\n"
+    "---ARTICLE---\n"
+    "Title: {title}\n"
+    "Source: {source}\n"
+    "Author: {author}\n"
+    "Content: {content}..."
+)
+
 class NewsAnalysisCrew:
-    def __init__(self):
+    def __init__(self, settings: Config = config):
         self.search_tool = SerperDevTool()
+        self.summary_model = settings.SUMMARY_MODEL
+        self.factcheck_model = settings.FACTCHECK_MODEL
+        self.credibility_model = settings.CREDIBILITY_MODEL
+        # Server-wide cap on concurrent agent runs; each analysis uses three
+        self._agent_semaphore = asyncio.Semaphore(settings.MAX_PARALLEL_AGENTS)
+        
+        # CrewAI agents keep per-run state, so each run takes an agent from a
+        # per-stage pool; the pool grows to the number of concurrent runs
+        self._agent_factories = {
+            "summary": self._create_summarizer_agent,
+            "fact_checks": self._create_fact_checker_agent,
+            "credibility": self._create_credibility_analyst_agent
+        }
+        self._agent_pools: Dict[str, List[Agent]] = {
+            stage: [factory()] for stage, factory in self._agent_factories.items()
+        }
+        self._task_factories = {
+            "summary": self._create_summarization_task,
+            "fact_checks": self._create_fact_checking_task,
+            "credibility": self._create_credibility_assessment_task
+        }
         
     def _create_summarizer_agent(self) -> Agent:
         """Create an agent specialized in summarizing news articles"""
@@ -23,7 +128,8 @@ class NewsAnalysisCrew:
             ),
             verbose=True,
             allow_delegation=False,
-            tools=[]
+            tools=[],
+            llm=ChatOpenAI(model=self.summary_model)
         )
     
     def _create_fact_checker_agent(self) -> Agent:
@@ -38,7 +144,8 @@ class NewsAnalysisCrew:
             ),
             verbose=True,
             allow_delegation=False,
-            tools=[self.search_tool]
+            tools=[self.search_tool],
+            llm=ChatOpenAI(model=self.factcheck_model)
         )
     
     def _create_credibility_analyst_agent(self) -> Agent:
@@ -53,90 +160,68 @@ class NewsAnalysisCrew:
             ),
             verbose=True,
             allow_delegation=False,
-            tools=[self.search_tool]
+            tools=[self.search_tool],
+            llm=ChatOpenAI(model=self.credibility_model)
         )
     
-    def _create_summarization_task(self, article: NewsArticle) -> Task:
+    def _create_summarization_task(self, article: NewsArticle, content: str, agent: Agent) -> Task:
         """Create a task for summarizing the news article"""
         return Task(
-            description=(
-                f"Summarize the following news article:\n"
-                f"Title: {article.title}\n"
-                f"Content: {article.content}\n\n"
-                f"Provide:\n"
-                f"1. A concise summary (2-3 sentences)\n"
-                f"2. Key points (3-5 bullet points)\n"
-                f"3. Sentiment analysis (positive/negative/neutral)\n"
-                f"Format your response as JSON with keys: summary, key_points, sentiment"
-            ),
+            description=_SUMMARY_TMPL.format_map({
+                "title": article.title,
+                "content": content
+            }),
             expected_output="A JSON object containing summary, key_points array, and sentiment",
-            agent=self._create_summarizer_agent()
+            output_pydantic=SummarySchema,
+            agent=agent
         )
     
-    def _create_fact_checking_task(self, article: NewsArticle) -> Task:
+    def _create_fact_checking_task(self, article: NewsArticle, content: str, agent: Agent) -> Task:
         """Create a task for fact-checking the news article"""
         return Task(
-            description=(
-                f"Fact-check the following news article:\n"
-                f"Title: {article.title}\n"
-                f"Content: {article.content}\n\n"
-                f"Identify key claims and verify them using reliable sources. "
-                f"For each claim, provide:\n"
-                f"1. The specific claim\n"
-                f"2. Verification status (verified/false/partially_true/unverified)\n"
-                f"3. Supporting evidence\n"
-                f"4. Confidence score (0-1)\n"
-                f"5. Sources used for verification\n"
-                f"Format as JSON array of fact-check objects"
-            ),
-            expected_output="A JSON array of fact-check objects with claim, status, evidence, confidence, and sources",
-            agent=self._create_fact_checker_agent()
+            description=_FACTCHECK_TMPL.format_map({
+                "title": article.title,
+                "content": content
+            }),
+            expected_output="A JSON object with a fact_checks array of objects with claim, verification_status, evidence, confidence_score, and sources",
+            output_pydantic=FactCheckListSchema,
+            agent=agent
         )
     
-    def _create_credibility_assessment_task(self, article: NewsArticle) -> Task:
+    def _create_credibility_assessment_task(self, article: NewsArticle, content: str, agent: Agent) -> Task:
         """Create a task for assessing article credibility"""
         return Task(
-            description=(
-                f"Assess the credibility of this news article and its source:\n"
-                f"Title: {article.title}\n"
-                f"Source: {article.source}\n"
-                f"Author: {article.author}\n"
-                f"Content: {article.content[:500]}...\n\n"
-                f"Evaluate based on:\n"
-                f"1. Source reputation and reliability\n"
-                f"2. Editorial standards and fact-checking practices\n"
-                f"3. Author credentials and expertise\n"
-                f"4. Content quality and journalistic standards\n"
-                f"5. Potential bias or agenda\n"
-                f"Provide a credibility score (0-100) and detailed assessment.\n"
-                f"Format as JSON with keys: credibility_score, assessment"
-            ),
+            description=_CREDIBILITY_TMPL.format_map({
+                "title": article.title,
+                "source": article.source,
+                "author": article.author,
+                "content": content
+            }),
             expected_output="A JSON object with credibility_score and detailed assessment",
-            agent=self._create_credibility_analyst_agent()
+            output_pydantic=CredibilitySchema,
+            agent=agent
         )
     
-    def analyze_article(self, article: NewsArticle) -> Dict[str, Any]:
+    def _prepare_contents(self, article: NewsArticle) -> Dict[str, str]:
+        """Build the article text sent to each analysis stage"""
+        # Condense and truncate the article once for all three tasks
+        condensed = top_k_sentences(article.content, k=20)
+        return {
+            "summary": condensed[:SUMMARY_CONTENT_CHARS],
+            "fact_checks": condensed[:FACTCHECK_CONTENT_CHARS],
+            "credibility": article.content[:CREDIBILITY_CONTENT_CHARS]
+        }
+    
+    async def analyze_article(self, article: NewsArticle) -> Dict[str, Any]:
         """Analyze a news article using the crew of AI agents"""
         try:
-            # Create tasks
-            summarization_task = self._create_summarization_task(article)
-            fact_checking_task = self._create_fact_checking_task(article)
-            credibility_task = self._create_credibility_assessment_task(article)
-            
-            # Create and run crew
-            crew = Crew(
-                agents=[
-                    self._create_summarizer_agent(),
-                    self._create_fact_checker_agent(),
-                    self._create_credibility_analyst_agent()
-                ],
-                tasks=[summarization_task, fact_checking_task, credibility_task],
-                process=Process.sequential,
-                verbose=True
-            )
+            # Sentence ranking is CPU-bound, so keep it off the event loop
+            contents = await asyncio.to_thread(self._prepare_contents, article)
             
-            # Execute the crew
-            results = crew.kickoff()
+            # The three tasks are independent, so each runs in its own crew concurrently
+            results = await asyncio.gather(*[
+                self._kickoff(stage, article, content) for stage, content in contents.items()
+            ])
             
             # Parse results
             return self._parse_crew_results(results)
@@ -145,47 +230,66 @@ class NewsAnalysisCrew:
             logger.error(f"Error in crew analysis: {str(e)}")
             raise
     
-    def _parse_crew_results(self, results: List[str]) -> Dict[str, Any]:
+    async def stream_article_analysis(self, article: NewsArticle) -> AsyncIterator[Tuple[str, Any, bool]]:
+        """Yield (stage, schema result, parsed ok) as each agent finishes"""
+        contents = await asyncio.to_thread(self._prepare_contents, article)
+        
+        async def run_stage(stage: str, content: str) -> Tuple[str, Union[BaseModel, str]]:
+            return stage, await self._kickoff(stage, article, content)
+        
+        for next_result in asyncio.as_completed([run_stage(stage, content) for stage, content in contents.items()]):
+            stage, result = await next_result
+            yield (stage, *self._parse_stage_result(stage, result))
+    
+    async def _kickoff(self, stage: str, article: NewsArticle, content: str) -> Union[BaseModel, str]:
+        """Run one stage in its own single-task crew on a worker thread"""
+        async with self._agent_semaphore:
+            # Take an idle agent, or build one if all are busy with other runs
+            pool = self._agent_pools[stage]
+            agent = pool.pop() if pool else self._agent_factories[stage]()
+            try:
+                crew = Crew(
+                    agents=[agent],
+                    tasks=[self._task_factories[stage](article, content, agent)],
+                    process=Process.sequential,
+                    verbose=True
+                )
+                return await asyncio.to_thread(crew.kickoff)
+            finally:
+                pool.append(agent)
+    
+    def _parse_stage_result(self, stage: str, result: Union[BaseModel, str]) -> Tuple[BaseModel, bool]:
+        """Validate a stage's output against its schema; the flag is False when defaults were used"""
+        try:
+            if not isinstance(result, BaseModel):
+                # CrewAI hands back the raw text when schema conversion fails
+                match = _JSON_BLOCK.search(result) or _JSON_OBJ.search(result)
+                payload = match.group(1 if match.lastindex else 0) if match else result
+                result = STAGE_SCHEMAS[stage].model_validate_json(payload)
+        except ValidationError:
+            logger.warning(f"Failed to parse {stage} result: {result}")
+            return STAGE_FALLBACKS[stage].model_copy(deep=True), False
+        
+        return result, True
+    
+    def _parse_crew_results(self, results: List[Union[BaseModel, str]]) -> Dict[str, Any]:
         """Parse the results from the crew execution"""
         try:
-            import json
-            
-            # Initialize default values
-            summary_data = {
-                "summary": "Unable to generate summary",
-                "key_points": [],
-                "sentiment": "neutral"
-            }
-            
-            fact_checks = []
-            credibility_data = {
-                "credibility_score": 50.0,
-                "assessment": "Unable to assess credibility"
-            }
-            
-            # Parse each result
-            for i, result in enumerate(results):
-                try:
-                    if i == 0:  # Summarization result
-                        summary_data = json.loads(result)
-                    elif i == 1:  # Fact-checking result
-                        fact_checks = json.loads(result)
-                    elif i == 2:  # Credibility assessment result
-                        credibility_data = json.loads(result)
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse result {i}: {result}")
-                    continue
-            
-            return {
-                "summary": summary_data,
-                "fact_checks": fact_checks,
-                "credibility": credibility_data
-            }
+            # Track which stages fell back to defaults so callers can skip caching them
+            parsed = {}
+            fallback_stages = []
+            for stage, result in zip(STAGE_SCHEMAS, results):
+                parsed[stage], ok = self._parse_stage_result(stage, result)
+                if not ok:
+                    fallback_stages.append(stage)
+            parsed["fallback_stages"] = fallback_stages
+            return parsed
             
         except Exception as e:
             logger.error(f"Error parsing crew results: {str(e)}")
             return {
-                "summary": {"summary": "Error generating summary", "key_points": [], "sentiment": "neutral"},
-                "fact_checks": [],
-                "credibility": {"credibility_score": 0.0, "assessment": "Error assessing credibility"}
+                "summary": SummarySchema(summary="Error generating summary", key_points=[], sentiment="neutral"),
+                "fact_checks": FactCheckListSchema(fact_checks=[]),
+                "credibility": CredibilitySchema(credibility_score=0.0, assessment="Error assessing credibility"),
+                "fallback_stages": list(STAGE_SCHEMAS)
             }
@@ -1,64 +1,87 @@
 import asyncio
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 import logging
-from models import NewsArticle, NewsAnalysis, Summary, FactCheck
+import orjson
+from urllib.parse import urlparse
+from pydantic import ValidationError
+from models import NewsArticle, NewsAnalysis, Summary
 from ..utils.news_scraper import NewsScraper, NewsScraperError
+from ..utils.cache import ResultCache
 from ..crew.news_crew import NewsAnalysisCrew
+from config import Config, config
 
 logger = logging.getLogger(__name__)
 
 class NewsService:
-    def __init__(self):
-        self.scraper = NewsScraper()
-        self.analysis_crew = NewsAnalysisCrew()
+    def __init__(self, settings: Config = config):
+        self.scraper = NewsScraper(settings)
+        self.analysis_crew = NewsAnalysisCrew(settings)
+        self.cache = ResultCache(settings.REDIS_URL)
+        self.analysis_cache_ttl = settings.ANALYSIS_CACHE_TTL
+        self.topic_cache_ttl = settings.TOPIC_CACHE_TTL
+        self.headlines_cache_ttl = settings.HEADLINES_CACHE_TTL
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.per_host_concurrency = settings.PER_HOST_CONCURRENCY
+        # host -> (semaphore, number of scrapes holding or waiting on it)
+        self._host_semaphores: Dict[str, Tuple[asyncio.Semaphore, int]] = {}
+    
+    async def close(self):
+        """Release connections held by the service"""
+        await self.scraper.close()
+        await self.cache.close()
     
     async def analyze_article_by_url(self, url: str) -> NewsAnalysis:
         """Analyze a news article from a given URL"""
+        # Concurrent requests for the same URL share a single analysis
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._track_inflight(url, asyncio.create_task(self._analyze_article(url)))
+        else:
+            logger.info(f"Joining in-flight analysis for: {url}")
+        
+        # Shield the shared task so one cancelled caller doesn't cancel the rest
+        return await asyncio.shield(task)
+    
+    def _track_inflight(self, url: str, task: asyncio.Task) -> asyncio.Task:
+        """Register a running analysis so later requests for the URL can join it"""
+        def forget(done: asyncio.Task):
+            # Only remove our own entry; a newer run may have replaced it
+            if self._inflight.get(url) is done:
+                del self._inflight[url]
+            # Failures are logged by the run itself, so don't warn when nobody awaited it
+            if not done.cancelled():
+                done.exception()
+        
+        self._inflight[url] = task
+        task.add_done_callback(forget)
+        return task
+    
+    async def _analyze_article(self, url: str) -> NewsAnalysis:
+        """Scrape, analyze and cache a single article"""
         start_time = time.time()
+        cache_key = f"analysis:{url}"
         
         try:
+            # Serve repeated URLs from the cache
+            cached = await self._get_cached_analysis(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit for article: {url}")
+                return cached
+            
             # Scrape the article
             logger.info(f"Scraping article from URL: {url}")
-            article = self.scraper.scrape_article(url)
+            article = await self._scrape_article(url)
             
             # Analyze the article with AI crew
             logger.info("Starting AI crew analysis...")
-            analysis_results = await self._run_crew_analysis(article)
+            analysis_results = await self.analysis_crew.analyze_article(article)
             
             # Parse results into structured format
-            summary = Summary(
-                original_title=article.title,
-                summary=analysis_results["summary"]["summary"],
-                key_points=analysis_results["summary"]["key_points"],
-                sentiment=analysis_results["summary"]["sentiment"]
-            )
-            
-            fact_checks = []
-            for fc_data in analysis_results["fact_checks"]:
-                fact_check = FactCheck(
-                    claim=fc_data.get("claim", ""),
-                    verification_status=fc_data.get("verification_status", "unverified"),
-                    evidence=fc_data.get("evidence", []),
-                    confidence_score=fc_data.get("confidence_score", 0.0),
-                    sources=fc_data.get("sources", [])
-                )
-                fact_checks.append(fact_check)
-            
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
-            # Create final analysis
-            news_analysis = NewsAnalysis(
-                article=article,
-                summary=summary,
-                fact_checks=fact_checks,
-                credibility_score=analysis_results["credibility"]["credibility_score"],
-                overall_assessment=analysis_results["credibility"]["assessment"],
-                processing_time=processing_time
-            )
-            
-            logger.info(f"Analysis completed in {processing_time:.2f} seconds")
+            news_analysis = self._build_analysis(article, analysis_results, start_time)
+            
+            logger.info(f"Analysis completed in {news_analysis.processing_time:.2f} seconds")
+            await self._cache_analysis(cache_key, news_analysis, analysis_results["fallback_stages"])
             return news_analysis
             
         except NewsScraperError as e:
@@ -68,11 +91,137 @@ class NewsService:
             logger.error(f"Error analyzing article: {str(e)}")
             raise
     
+    async def stream_article_analysis(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """Analyze a news article from a given URL, yielding each stage as it completes"""
+        # Share an analysis already running for this URL instead of repeating it
+        task = self._inflight.get(url)
+        if task is not None:
+            logger.info(f"Joining in-flight analysis for: {url}")
+            news_analysis = await asyncio.shield(task)
+            yield {"stage": "complete", "data": news_analysis.model_dump(mode="json")}
+            return
+        
+        # The run doesn't depend on this client, so requests that join it still
+        # get a result if the client disconnects
+        events: asyncio.Queue = asyncio.Queue()
+        task = self._track_inflight(url, asyncio.create_task(self._stream_article(url, events)))
+        
+        while (event := await events.get()) is not None:
+            yield event
+        
+        news_analysis = await asyncio.shield(task)
+        yield {"stage": "complete", "data": news_analysis.model_dump(mode="json")}
+    
+    async def _stream_article(self, url: str, events: asyncio.Queue) -> NewsAnalysis:
+        """Scrape, analyze and cache a single article, queueing each stage as it completes"""
+        start_time = time.time()
+        cache_key = f"analysis:{url}"
+        
+        try:
+            cached = await self._get_cached_analysis(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit for article: {url}")
+                return cached
+            
+            logger.info(f"Scraping article from URL: {url}")
+            article = await self._scrape_article(url)
+            events.put_nowait({"stage": "article", "data": article.model_dump(mode="json")})
+            
+            # Forward each agent's result as soon as it is available
+            logger.info("Starting streamed AI crew analysis...")
+            analysis_results = {"fallback_stages": []}
+            async for stage, data, ok in self.analysis_crew.stream_article_analysis(article):
+                analysis_results[stage] = data
+                if not ok:
+                    analysis_results["fallback_stages"].append(stage)
+                payload = data.model_dump(mode="json")
+                events.put_nowait({"stage": stage, "data": payload["fact_checks"] if stage == "fact_checks" else payload})
+            
+            news_analysis = self._build_analysis(article, analysis_results, start_time)
+            logger.info(f"Streamed analysis completed in {news_analysis.processing_time:.2f} seconds")
+            await self._cache_analysis(cache_key, news_analysis, analysis_results["fallback_stages"])
+            return news_analysis
+            
+        except Exception as e:
+            logger.error(f"Error in streamed analysis: {str(e)}")
+            raise
+        finally:
+            # Tell the streaming client there are no more stage events
+            events.put_nowait(None)
+    
+    async def _get_cached_analysis(self, cache_key: str) -> Optional[NewsAnalysis]:
+        """Return a cached analysis, treating entries that no longer validate as misses"""
+        cached = await self.cache.get(cache_key)
+        if cached is None:
+            return None
+        try:
+            return NewsAnalysis.model_validate_json(cached)
+        except ValidationError as e:
+            logger.warning(f"Ignoring invalid cached analysis {cache_key}: {str(e)}")
+            return None
+    
+    async def _cache_analysis(self, cache_key: str, news_analysis: NewsAnalysis, fallback_stages: List[str]):
+        """Cache an analysis only if every stage produced real output"""
+        if fallback_stages:
+            logger.warning(f"Not caching analysis with default {', '.join(fallback_stages)} results")
+            return
+        await self.cache.set(cache_key, news_analysis.model_dump_json(), self.analysis_cache_ttl)
+    
+    async def _scrape_article(self, url: str) -> NewsArticle:
+        """Scrape an article, limiting concurrent requests to the same host"""
+        host = urlparse(url).netloc
+        semaphore, users = self._host_semaphores.get(host, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+        self._host_semaphores[host] = (semaphore, users + 1)
+        
+        try:
+            async with semaphore:
+                return await self.scraper.scrape_article(url)
+        finally:
+            # Forget the host once nobody is using its semaphore
+            semaphore, users = self._host_semaphores[host]
+            if users == 1:
+                del self._host_semaphores[host]
+            else:
+                self._host_semaphores[host] = (semaphore, users - 1)
+    
+    def _build_analysis(self, article: NewsArticle, analysis_results: Dict[str, Any], start_time: float) -> NewsAnalysis:
+        """Assemble parsed crew results into a NewsAnalysis"""
+        # The crew has already validated each stage against its schema (or
+        # substituted defaults), so the fields skip re-validation
+        summary_data = analysis_results["summary"]
+        summary = Summary.model_construct(
+            original_title=article.title,
+            summary=summary_data.summary,
+            key_points=summary_data.key_points,
+            sentiment=summary_data.sentiment
+        )
+        
+        # Calculate processing time
+        processing_time = time.time() - start_time
+        
+        return NewsAnalysis.model_construct(
+            article=article,
+            summary=summary,
+            fact_checks=analysis_results["fact_checks"].fact_checks,
+            credibility_score=analysis_results["credibility"].credibility_score,
+            overall_assessment=analysis_results["credibility"].assessment,
+            processing_time=processing_time
+        )
+    
     async def search_and_analyze_topic(self, topic: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search for news articles on a topic and return basic information"""
+        cache_key = f"topic:{topic.lower().strip()}:{limit}"
+        
         try:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit for topic: {topic}")
+                return orjson.loads(cached)
+            
             logger.info(f"Searching for articles on topic: {topic}")
-            articles = self.scraper.search_news_by_topic(topic, limit)
+            articles = await self.scraper.search_news_by_topic(topic, limit)
             
             # Return basic article information without full analysis
             results = []
@@ -87,6 +236,7 @@ class NewsService:
                 })
             
             logger.info(f"Found {len(results)} articles for topic: {topic}")
+            await self.cache.set(cache_key, orjson.dumps(results).decode(), self.topic_cache_ttl)
             return results
             
         except NewsScraperError as e:
@@ -98,9 +248,16 @@ class NewsService:
     
     async def get_top_headlines(self, category: str = "general", limit: int = 10) -> List[Dict[str, Any]]:
         """Get top headlines from news sources"""
+        cache_key = f"headlines:{category}:{limit}"
+        
         try:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit for headlines: {category}")
+                return orjson.loads(cached)
+            
             logger.info(f"Getting top headlines for category: {category}")
-            headlines = self.scraper.get_top_headlines(category, limit)
+            headlines = await self.scraper.get_top_headlines(category, limit)
             
             results = []
             for headline_data in headlines:
@@ -114,6 +271,7 @@ class NewsService:
                 })
             
             logger.info(f"Retrieved {len(results)} headlines for category: {category}")
+            await self.cache.set(cache_key, orjson.dumps(results).decode(), self.headlines_cache_ttl)
             return results
             
         except NewsScraperError as e:
@@ -123,17 +281,6 @@ class NewsService:
             logger.error(f"Unexpected error getting headlines: {str(e)}")
             raise
     
-    async def _run_crew_analysis(self, article: NewsArticle) -> Dict[str, Any]:
-        """Run the AI crew analysis in a separate thread to avoid blocking"""
-        loop = asyncio.get_event_loop()
-        
-        # Run crew analysis in thread pool to avoid blocking
-        return await loop.run_in_executor(
-            None, 
-            self.analysis_crew.analyze_article, 
-            article
-        )
-    
     async def batch_analyze_articles(self, urls: List[str]) -> List[NewsAnalysis]:
         """Analyze multiple articles concurrently"""
         try:
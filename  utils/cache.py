@@ -0,0 +1,64 @@
+import time
+import logging
+from typing import Optional, Dict, Tuple
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+class ResultCache:
+    """Cache for serialized results, backed by Redis when a URL is configured"""
+
+    def __init__(self, redis_url: Optional[str] = None, prefix: str = "news-bot", max_local_entries: int = 1024):
+        self.prefix = prefix
+        self.max_local_entries = max_local_entries
+        self._redis = redis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self._local: Dict[str, Tuple[float, str]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value for a key, or None on a miss"""
+        key = f"{self.prefix}:{key}"
+
+        if self._redis is None:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._local.pop(key, None)
+                return None
+            return value
+
+        try:
+            return await self._redis.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {str(e)}")
+            return None
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store a value under a key for ttl seconds"""
+        key = f"{self.prefix}:{key}"
+
+        if self._redis is None:
+            now = time.monotonic()
+            # Re-insert overwritten keys so dict order stays the order of writes
+            self._local.pop(key, None)
+            if len(self._local) >= self.max_local_entries:
+                # Purge expired entries before evicting a live one
+                expired = [k for k, (expires_at, _) in self._local.items() if expires_at < now]
+                for k in expired:
+                    del self._local[k]
+                if not expired:
+                    # Evict the oldest write
+                    self._local.pop(next(iter(self._local)))
+            self._local[key] = (now + ttl, value)
+            return
+
+        try:
+            await self._redis.set(key, value, ex=ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Cache write failed for {key}: {str(e)}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool if one is open"""
+        if self._redis is not None:
+            await self._redis.aclose()
@@ -1,10 +1,12 @@
-import requests
-from newspaper import Article
-from bs4 import BeautifulSoup
-from typing import Optional, List, Dict
+import asyncio
+import httpx
+import trafilatura
+from selectolax.parser import HTMLParser
+from typing import Optional, List, Dict, Tuple, Callable, Awaitable
 import logging
 from datetime import datetime
-from config import config
+from urllib.parse import urlparse
+from config import Config, config
 from models import NewsArticle
 
 logger = logging.getLogger(__name__)
@@ -14,37 +16,120 @@ class NewsScraperError(Exception):
     pass
 
 class NewsScraper:
-    def __init__(self):
-        self.news_api_key = config.NEWS_API_KEY
-        self.base_url = config.NEWS_API_BASE_URL
+    def __init__(self, settings: Config = config):
+        self.news_api_key = settings.NEWS_API_KEY
+        self.base_url = settings.NEWS_API_BASE_URL
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
         
-    def scrape_article(self, url: str) -> NewsArticle:
+        # News API listing requests currently running, keyed by their parameters
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+    
+    async def close(self):
+        """Close the pooled HTTP client"""
+        await self._client.aclose()
+        
+    async def scrape_article(self, url: str) -> NewsArticle:
         """Scrape a news article from a given URL"""
         try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            
-            # Extract publish date
-            publish_date = None
-            if article.publish_date:
-                publish_date = article.publish_date
+            response = await self._client.get(url, follow_redirects=True)
+            response.raise_for_status()
             
-            return NewsArticle(
-                title=article.title or "No title found",
-                url=url,
-                content=article.text or "No content found",
-                author=", ".join(article.authors) if article.authors else None,
-                publish_date=publish_date,
-                source=article.source_url or url
-            )
+            # Parsing is CPU-bound, so keep it off the event loop. Pass the raw bytes so
+            # the parsers can honour the page's <meta charset> when the header has none
+            return await asyncio.to_thread(self._parse_article, url, response.content)
             
         except Exception as e:
             logger.error(f"Error scraping article from {url}: {str(e)}")
             raise NewsScraperError(f"Failed to scrape article: {str(e)}")
     
-    def search_news_by_topic(self, topic: str, limit: int = 5) -> List[Dict]:
+    def _parse_article(self, url: str, html: bytes) -> NewsArticle:
+        """Extract article fields from downloaded HTML"""
+        # trafilatura reads bylines, JSON-LD and meta tags along with the body text.
+        # with_metadata would discard pages missing a date, so it is left off
+        extracted = trafilatura.bare_extraction(
+            html,
+            url=url,
+            include_comments=False,
+            include_tables=False
+        ) or {}
+        tree = HTMLParser(html, detect_encoding=True)
+        
+        title_node = tree.css_first("title")
+        title = (
+            extracted.get("title")
+            or self._meta_content(tree, 'meta[property="og:title"]')
+            or (title_node.text(strip=True) if title_node else None)
+        )
+        
+        author = (
+            extracted.get("author")
+            or self._meta_content(tree, 'meta[name="author"]')
+            or self._meta_content(tree, 'meta[property="article:author"]')
+        )
+        
+        # Extract publish date, preferring the full timestamp over trafilatura's day-level date
+        publish_date = None
+        for published_time in (
+            self._meta_content(tree, 'meta[property="article:published_time"]'),
+            extracted.get("date")
+        ):
+            if not published_time:
+                continue
+            try:
+                publish_date = datetime.fromisoformat(published_time.replace("Z", "+00:00"))
+                break
+            except ValueError:
+                logger.warning(f"Unrecognized publish date for {url}: {published_time}")
+        
+        parsed_url = urlparse(url)
+        return NewsArticle(
+            title=title or "No title found",
+            url=url,
+            content=extracted.get("text") or "No content found",
+            author=author,
+            publish_date=publish_date,
+            source=f"{parsed_url.scheme}://{parsed_url.netloc}" if parsed_url.netloc else url
+        )
+    
+    @staticmethod
+    def _meta_content(tree: HTMLParser, selector: str) -> Optional[str]:
+        """Return the stripped content attribute of the first matching meta tag"""
+        node = tree.css_first(selector)
+        if node is None:
+            return None
+        return (node.attributes.get("content") or "").strip() or None
+    
+    async def search_news_by_topic(self, topic: str, limit: int = 5) -> List[Dict]:
         """Search for news articles by topic using News API"""
+        return await self._fetch_shared(
+            ("topic", topic.lower().strip(), limit),
+            lambda: self._fetch_news_by_topic(topic, limit)
+        )
+    
+    async def get_top_headlines(self, category: str = 'general', limit: int = 10) -> List[Dict]:
+        """Get top headlines from News API"""
+        return await self._fetch_shared(
+            ("headlines", category, limit),
+            lambda: self._fetch_top_headlines(category, limit)
+        )
+    
+    async def _fetch_shared(self, key: Tuple, fetch: Callable[[], Awaitable[List[Dict]]]) -> List[Dict]:
+        """Run a fetch, sharing a single request between concurrent callers with the same key"""
+        # Results are cached by NewsService, so only requests in flight are shared here
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        return await asyncio.shield(task)
+    
+    async def _fetch_news_by_topic(self, topic: str, limit: int) -> List[Dict]:
+        """Query the News API everything endpoint"""
         try:
             url = f"{self.base_url}/everything"
             params = {
@@ -55,7 +140,7 @@ class NewsScraper:
                 'language': 'en'
             }
             
-            response = requests.get(url, params=params)
+            response = await self._client.get(url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -77,15 +162,15 @@ class NewsScraper:
             
             return articles
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request error while searching news: {str(e)}")
             raise NewsScraperError(f"Failed to search news: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error while searching news: {str(e)}")
             raise NewsScraperError(f"Unexpected error: {str(e)}")
     
-    def get_top_headlines(self, category: str = 'general', limit: int = 10) -> List[Dict]:
-        """Get top headlines from News API"""
+    async def _fetch_top_headlines(self, category: str, limit: int) -> List[Dict]:
+        """Query the News API top-headlines endpoint"""
         try:
             url = f"{self.base_url}/top-headlines"
             params = {
@@ -95,7 +180,7 @@ class NewsScraper:
                 'country': 'us'
             }
             
-            response = requests.get(url, params=params)
+            response = await self._client.get(url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -117,7 +202,7 @@ class NewsScraper:
             
             return articles
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request error while getting headlines: {str(e)}")
             raise NewsScraperError(f"Failed to get headlines: {str(e)}")
         except Exception as e:
@@ -0,0 +1,89 @@
+import re
+import threading
+from typing import List
+import numpy as np
+from numba import njit, prange
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+# Sentences shorter than this ("Advertisement.", "Read more.") are page boilerplate
+MIN_SENTENCE_TOKENS = 5
+
+_STOPWORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his i in is it its "
+    "of on or our she that the their them they this to was we were which who will with "
+    "would you your".split()
+)
+
+# Numba's default workqueue threading layer doesn't support concurrent launches
+# of parallel kernels, and top_k_sentences runs on worker threads
+_KERNEL_LOCK = threading.Lock()
+
+@njit(cache=True, parallel=True)
+def _top_k_indices(token_ids, sentence_offsets, doc_freqs, k):
+    """Score sentences by TF-IDF over sqrt length and return the top k in document order"""
+    n_sentences = sentence_offsets.shape[0] - 1
+    scores = np.zeros(n_sentences, dtype=np.float64)
+
+    for i in prange(n_sentences):
+        start = sentence_offsets[i]
+        end = sentence_offsets[i + 1]
+        if end == start:
+            continue
+
+        total = 0.0
+        for j in range(start, end):
+            total += np.log((n_sentences + 1.0) / (doc_freqs[token_ids[j]] + 1.0)) + 1.0
+        # Dampen rather than remove the length bias so a one-off rare word can't win
+        scores[i] = total / np.sqrt(end - start)
+
+    return np.sort(np.argsort(-scores)[:k])
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into non-empty sentences"""
+    return [sentence for sentence in _SENTENCE_SPLIT.split(text.strip()) if sentence]
+
+def top_k_sentences(text: str, k: int = 20) -> str:
+    """Keep the k most informative sentences of an article, preserving their order"""
+    sentences = _split_sentences(text)
+    if len(sentences) <= k:
+        return text
+
+    # Drop boilerplate fragments before ranking, then rank the rest on content words
+    candidates = []
+    sentence_tokens = []
+    for sentence in sentences:
+        tokens = _TOKEN.findall(sentence.lower())
+        if len(tokens) >= MIN_SENTENCE_TOKENS:
+            candidates.append(sentence)
+            sentence_tokens.append([token for token in tokens if token not in _STOPWORDS])
+    if len(candidates) <= k:
+        # Nothing to rank, and short sentences may be all the article has
+        return text
+
+    # Map tokens to integer ids and count the sentences each token appears in
+    vocab = {}
+    token_ids = []
+    sentence_offsets = [0]
+    doc_freqs = []
+    for tokens in sentence_tokens:
+        seen = set()
+        for token in tokens:
+            token_id = vocab.setdefault(token, len(vocab))
+            if token_id == len(doc_freqs):
+                doc_freqs.append(0)
+            if token_id not in seen:
+                seen.add(token_id)
+                doc_freqs[token_id] += 1
+            token_ids.append(token_id)
+        sentence_offsets.append(len(token_ids))
+
+    with _KERNEL_LOCK:
+        indices = _top_k_indices(
+            np.array(token_ids, dtype=np.uint32),
+            np.array(sentence_offsets, dtype=np.int64),
+            np.array(doc_freqs, dtype=np.int64),
+            k
+        )
+    return " ".join(candidates[i] for i in indices)
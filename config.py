@@ -1,38 +1,76 @@
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    SERPER_API_KEY = os.getenv("SERPER_API_KEY")
-    NEWS_API_KEY = os.getenv("NEWS_API_KEY")
-    
-    # OpenAI Configuration
-    OPENAI_MODEL = "gpt-3.5-turbo"
-    
+    OPENAI_API_KEY: Optional[str] = None
+    SERPER_API_KEY: Optional[str] = None
+    NEWS_API_KEY: Optional[str] = None
+
+    # OpenAI Configuration, per agent: only fact-checking needs the larger model
+    SUMMARY_MODEL: str = "gpt-4o-mini"
+    FACTCHECK_MODEL: str = "gpt-4o"
+    CREDIBILITY_MODEL: str = "gpt-4o-mini"
+
+    # Crew Configuration: agent runs in flight across the whole server (three per analysis)
+    MAX_PARALLEL_AGENTS: int = 12
+
+    # Cache Configuration
+    REDIS_URL: Optional[str] = None
+    ANALYSIS_CACHE_TTL: int = 3600
+    TOPIC_CACHE_TTL: int = 300
+    HEADLINES_CACHE_TTL: int = 60
+
+    # Scraper Configuration
+    PER_HOST_CONCURRENCY: int = 4
+
+    # Thread Pool Configuration
+    THREAD_POOL_WORKERS: int = 32
+
     # API Configuration
-    API_HOST = "0.0.0.0"
-    API_PORT = 8000
-    
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+
     # News API Configuration
-    NEWS_API_BASE_URL = "https://newsapi.org/v2"
-    
+    NEWS_API_BASE_URL: str = "https://newsapi.org/v2"
+
     @classmethod
-    def validate(cls):
+    def from_env(cls) -> "Config":
+        """Build the configuration from environment variables"""
+        return cls(
+            OPENAI_API_KEY=os.getenv("OPENAI_API_KEY"),
+            SERPER_API_KEY=os.getenv("SERPER_API_KEY"),
+            NEWS_API_KEY=os.getenv("NEWS_API_KEY"),
+            SUMMARY_MODEL=os.getenv("SUMMARY_MODEL", "gpt-4o-mini"),
+            FACTCHECK_MODEL=os.getenv("FACTCHECK_MODEL", "gpt-4o"),
+            CREDIBILITY_MODEL=os.getenv("CREDIBILITY_MODEL", "gpt-4o-mini"),
+            MAX_PARALLEL_AGENTS=int(os.getenv("MAX_PARALLEL_AGENTS", "12")),
+            REDIS_URL=os.getenv("REDIS_URL"),
+            ANALYSIS_CACHE_TTL=int(os.getenv("ANALYSIS_CACHE_TTL", "3600")),
+            TOPIC_CACHE_TTL=int(os.getenv("TOPIC_CACHE_TTL", "300")),
+            HEADLINES_CACHE_TTL=int(os.getenv("HEADLINES_CACHE_TTL", "60")),
+            PER_HOST_CONCURRENCY=int(os.getenv("PER_HOST_CONCURRENCY", "4")),
+            THREAD_POOL_WORKERS=int(os.getenv("THREAD_POOL_WORKERS", "32"))
+        )
+
+    def validate(self):
         """Validate that all required environment variables are set"""
         required_vars = [
             "OPENAI_API_KEY",
-            "SERPER_API_KEY", 
+            "SERPER_API_KEY",
             "NEWS_API_KEY"
         ]
-        
+
         missing_vars = []
         for var in required_vars:
-            if not getattr(cls, var):
+            if not getattr(self, var):
                 missing_vars.append(var)
-        
+
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
 
-config = Config()
\ No newline at end of file
+config = Config.from_env()
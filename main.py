@@ -1,11 +1,14 @@
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import List, Dict, Any
 
+import orjson
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from config import config
 from models import (
@@ -43,21 +46,28 @@ async def lifespan(app: FastAPI):
         logger.error(f"Configuration validation failed: {str(e)}")
         raise
     
+    # Size the default executor so batch scrapes and crew runs overlap
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=config.THREAD_POOL_WORKERS)
+    )
+    
     # Initialize services
-    news_service = NewsService()
+    news_service = NewsService(config)
     logger.info("News service initialized")
     
     yield
     
     # Shutdown
     logger.info("Shutting down News Bot API...")
+    await news_service.close()
 
 # Create FastAPI app
 app = FastAPI(
     title="News Summarization & Fact-Checking Bot",
     description="AI-powered news analysis tool that summarizes articles and verifies their credibility",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -88,7 +98,11 @@ async def health_check():
         "service": "news-bot"
     }
 
-@app.post("/analyze/article", response_model=NewsAnalysis)
+@app.post(
+    "/analyze/article",
+    response_model=None,
+    responses={200: {"model": NewsAnalysis}}
+)
 async def analyze_article(request: NewsArticleRequest):
     """Analyze a single news article from URL"""
     try:
@@ -97,7 +111,8 @@ async def analyze_article(request: NewsArticleRequest):
         analysis = await news_service.analyze_article_by_url(str(request.url))
         
         logger.info(f"Analysis completed for: {request.url}")
-        return analysis
+        # Serialize directly with pydantic-core instead of re-validating via response_model
+        return Response(content=analysis.model_dump_json(), media_type="application/json")
         
     except NewsScraperError as e:
         logger.error(f"Scraping error: {str(e)}")
@@ -112,6 +127,26 @@ async def analyze_article(request: NewsArticleRequest):
             detail=f"Analysis failed: {str(e)}"
         )
 
+@app.post("/analyze/article/stream")
+async def analyze_article_stream(request: NewsArticleRequest):
+    """Stream the analysis of a single news article as server-sent events"""
+    logger.info(f"Streaming analysis for article: {request.url}")
+    
+    async def event_stream():
+        try:
+            async for event in news_service.stream_article_analysis(str(request.url)):
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+        except NewsScraperError as e:
+            logger.error(f"Scraping error: {str(e)}")
+            error = {"stage": "error", "status_code": 400, "detail": f"Failed to scrape article: {str(e)}"}
+            yield b"data: " + orjson.dumps(error) + b"\n\n"
+        except Exception as e:
+            logger.error(f"Analysis error: {str(e)}")
+            error = {"stage": "error", "status_code": 500, "detail": f"Analysis failed: {str(e)}"}
+            yield b"data: " + orjson.dumps(error) + b"\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.post("/analyze/batch")
 async def batch_analyze_articles(urls: List[str]):
     """Analyze multiple articles concurrently"""
@@ -220,7 +255,7 @@ async def get_headlines(category: str = "general", limit: int = 10):
 async def global_exception_handler(request, exc):
     """Global exception handler"""
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
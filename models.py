@@ -24,11 +24,24 @@ class Summary(BaseModel):
     sentiment: str
     
 class FactCheck(BaseModel):
-    claim: str
-    verification_status: str  # "verified", "false", "partially_true", "unverified"
-    evidence: List[str]
-    confidence_score: float
-    sources: List[str]
+    claim: str = ""
+    verification_status: str = "unverified"  # "verified", "false", "partially_true", "unverified"
+    evidence: List[str] = []
+    confidence_score: float = 0.0
+    sources: List[str] = []
+
+# Structured outputs requested from the crew agents
+class SummarySchema(BaseModel):
+    summary: str
+    key_points: List[str]
+    sentiment: str  # "positive", "negative", "neutral"
+
+class FactCheckListSchema(BaseModel):
+    fact_checks: List[FactCheck]
+
+class CredibilitySchema(BaseModel):
+    credibility_score: float
+    assessment: str
 
 class NewsAnalysis(BaseModel):
     article: NewsArticle